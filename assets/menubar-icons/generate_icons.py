@@ -11,31 +11,52 @@ Icons are 22x22 pixels (standard menu bar size) with transparency.
 """
 
 from PIL import Image, ImageDraw
+import numpy as np
+import argparse
+import hashlib
+import os
 import sys
 
+# Status colors (Apple system palette), fully opaque RGBA
+GREEN_RGBA = (52, 199, 89, 255)     # Apple's system green
+YELLOW_RGBA = (255, 204, 0, 255)    # Apple's system yellow/orange
+RED_RGBA = (255, 59, 48, 255)       # Apple's system red
+
+# Document icon colors (light gray for visibility on both themes)
+DOC_RGBA = (160, 160, 160, 255)
+DOC_FOLD_RGBA = (100, 100, 100, 255)
+
+# Hash of the inputs the icons in the working directory were generated from
+CACHE_FILE = '.icons.cache'
+
+# Distance past the nominal radius a pixel center may lie and still be
+# filled; matches Pillow's ellipse rasterisation at the default 22px size
+CIRCLE_EDGE = 0.4
+
 def create_circle_icon(color, output_path, size=22):
     """
     Create a simple circular status icon.
 
     Args:
-        color: RGB tuple (r, g, b)
+        color: RGBA tuple (r, g, b, a)
         output_path: Path to save the PNG file
         size: Icon size in pixels (default 22x22)
     """
-    # Create image with transparency
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
     # Calculate circle dimensions (with some padding)
     padding = 3
     circle_size = size - (padding * 2)
 
-    # Draw circle
-    draw.ellipse(
-        [padding, padding, padding + circle_size, padding + circle_size],
-        fill=color + (255,),  # Add alpha channel (fully opaque)
-        outline=None
-    )
+    # Hard-edged disc over the same pixels ImageDraw.ellipse filled; exact
+    # at 22px, within a pixel along the edge at other sizes
+    center = padding + circle_size / 2
+    radius = circle_size / 2 + CIRCLE_EDGE
+    yy, xx = np.ogrid[:size, :size]
+    mask = (xx - center) ** 2 + (yy - center) ** 2 <= radius ** 2
+
+    arr = np.zeros((size, size, 4), dtype=np.uint8)
+    arr[mask] = color
+
+    img = Image.fromarray(arr, 'RGBA')
 
     # Save the image
     img.save(output_path, 'PNG')
@@ -46,16 +67,13 @@ def create_document_icon(color, output_path, size=22):
     Create a document/paper icon with a colored status dot.
 
     Args:
-        color: RGB tuple for the status dot
+        color: RGBA tuple for the status dot
         output_path: Path to save the PNG file
         size: Icon size in pixels
     """
     # Create image with transparency
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    # Document color (light gray for visibility on both themes)
-    doc_color = (160, 160, 160, 255)
+    draw = ImageDraw.Draw(img, 'RGBA')
 
     # Draw document outline (simplified paper shape)
     # Main rectangle
@@ -66,7 +84,7 @@ def create_document_icon(color, output_path, size=22):
     # Document body
     draw.rectangle(
         [doc_padding, doc_padding, doc_padding + doc_width, doc_padding + doc_height],
-        fill=doc_color,
+        fill=DOC_RGBA,
         outline=None
     )
 
@@ -77,7 +95,7 @@ def create_document_icon(color, output_path, size=22):
         (size - doc_padding, doc_padding),
         (size - doc_padding, doc_padding + fold_size)
     ]
-    draw.polygon(fold_points, fill=(100, 100, 100, 255))
+    draw.polygon(fold_points, fill=DOC_FOLD_RGBA)
 
     # Status dot (bottom-right corner)
     dot_size = 6
@@ -86,7 +104,7 @@ def create_document_icon(color, output_path, size=22):
 
     draw.ellipse(
         [dot_x, dot_y, dot_x + dot_size, dot_y + dot_size],
-        fill=color + (255,),
+        fill=color,
         outline=None
     )
 
@@ -94,41 +112,82 @@ def create_document_icon(color, output_path, size=22):
     img.save(output_path, 'PNG')
     print(f"Created: {output_path}")
 
-def main():
-    """Generate all status icons."""
+def inputs_hash(colors):
+    """
+    Hash everything the generated icons depend on.
+
+    Args:
+        colors: Mapping of color name to RGBA tuple
+
+    Returns:
+        Hex digest of this script's source and the color table
+    """
+    digest = hashlib.sha256()
+    with open(__file__, 'rb') as f:
+        digest.update(f.read())
+    digest.update(repr(sorted(colors.items())).encode())
+    return digest.hexdigest()
+
+def main(check_hash=False):
+    """
+    Generate all status icons.
+
+    Args:
+        check_hash: Skip generation when the inputs hash matches CACHE_FILE
+                    and every output icon already exists
+    """
     # Colors for each state
     colors = {
-        'green': (52, 199, 89),    # Apple's system green
-        'yellow': (255, 204, 0),   # Apple's system yellow/orange
-        'red': (255, 59, 48),      # Apple's system red
+        'green': GREEN_RGBA,
+        'yellow': YELLOW_RGBA,
+        'red': RED_RGBA,
     }
 
+    current_hash = inputs_hash(colors)
+    if check_hash and os.path.exists(CACHE_FILE):
+        outputs = [f"icon-{name}-22.png" for name in colors]
+        outputs += [f"icon-{name}-doc-22.png" for name in colors]
+        with open(CACHE_FILE) as f:
+            cached_hash = f.read().strip()
+        if cached_hash == current_hash and all(os.path.exists(o) for o in outputs):
+            print("Icons are up to date, skipping generation")
+            return
+
     print("Generating menu bar icons...")
     print("Style: Simple circles (clean and minimal)")
 
     # Generate simple circle icons (recommended for menu bar)
-    for color_name, rgb in colors.items():
+    for color_name, rgba in colors.items():
         output = f"icon-{color_name}-22.png"
-        create_circle_icon(rgb, output, size=22)
+        create_circle_icon(rgba, output, size=22)
 
     print("\nGenerating document-style icons (alternative)...")
 
     # Generate document icons (alternative style)
-    for color_name, rgb in colors.items():
+    for color_name, rgba in colors.items():
         output = f"icon-{color_name}-doc-22.png"
-        create_document_icon(rgb, output, size=22)
+        create_document_icon(rgba, output, size=22)
+
+    with open(CACHE_FILE, 'w') as f:
+        f.write(current_hash + '\n')
 
     print("\nAll icons generated successfully!")
     print("\nUsage:")
     print("- Use the simple circle icons (icon-*-22.png) for best menu bar visibility")
     print("- Document icons available as alternative if preferred")
-    print("- To use in Go: read PNG file and embed in icons.go")
+    print("- icons.go embeds the PNGs with go:embed; rebuild to pick up changes")
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate menu bar status icons.")
+    parser.add_argument('--check-hash', action='store_true',
+                        help=f"skip generation if inputs are unchanged since the last run ({CACHE_FILE})")
+    args = parser.parse_args()
+
     try:
         from PIL import Image, ImageDraw
-        main()
+        import numpy as np
+        main(check_hash=args.check_hash)
     except ImportError:
-        print("Error: PIL/Pillow is required")
-        print("Install with: pip3 install Pillow")
+        print("Error: PIL/Pillow and NumPy are required")
+        print("Install with: pip3 install Pillow numpy")
         sys.exit(1)
@@ -0,0 +1,34 @@
+// Package menubaricons provides embedded icon data for the menu bar application.
+// The PNGs are produced by generate_icons.py and embedded as-is.
+package menubaricons
+
+import (
+	_ "embed"
+)
+
+//go:embed icon-green-22.png
+var iconGreenPNG []byte
+
+//go:embed icon-yellow-22.png
+var iconYellowPNG []byte
+
+//go:embed icon-red-22.png
+var iconRedPNG []byte
+
+// iconGreen returns a green status icon.
+// 22x22 PNG with transparency, optimized for macOS menu bar.
+func iconGreen() []byte {
+	return iconGreenPNG
+}
+
+// iconYellow returns a yellow status icon.
+// 22x22 PNG with transparency, optimized for macOS menu bar.
+func iconYellow() []byte {
+	return iconYellowPNG
+}
+
+// iconRed returns a red status icon.
+// 22x22 PNG with transparency, optimized for macOS menu bar.
+func iconRed() []byte {
+	return iconRedPNG
+}
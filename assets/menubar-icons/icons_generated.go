@@ -1,67 +0,0 @@
-// Package menubaricons provides embedded icon data for the menu bar application.
-// Generated icon data - DO NOT EDIT MANUALLY
-// Generated from assets/menubar-icons/*.png
-package menubaricons
-
-// iconGreen returns a green status icon.
-// 22x22 PNG with transparency, optimized for macOS menu bar.
-func iconGreen() []byte {
-	return []byte{
-		0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A, 0x00, 0x00, 0x00, 0x0D,
-		0x49, 0x48, 0x44, 0x52, 0x00, 0x00, 0x00, 0x16, 0x00, 0x00, 0x00, 0x16,
-		0x08, 0x06, 0x00, 0x00, 0x00, 0xC4, 0xB4, 0x6C, 0x3B, 0x00, 0x00, 0x00,
-		0x6F, 0x49, 0x44, 0x41, 0x54, 0x78, 0x9C, 0x63, 0x60, 0x18, 0x05, 0x50,
-		0xC0, 0xC8, 0x40, 0x04, 0x30, 0x39, 0x1E, 0xF9, 0x1F, 0x5D, 0xEC, 0x8C,
-		0xE5, 0x72, 0xBC, 0x7A, 0x19, 0x49, 0x35, 0x90, 0x58, 0x0B, 0x98, 0x18,
-		0x28, 0x30, 0x14, 0x9F, 0x3A, 0x26, 0x4A, 0x0C, 0xC5, 0xA7, 0x9E, 0x89,
-		0x52, 0x43, 0x71, 0xE9, 0xC3, 0x19, 0x14, 0x94, 0x02, 0x26, 0x6A, 0xB8,
-		0x16, 0x9B, 0x7E, 0xFA, 0xB8, 0x98, 0x9A, 0x60, 0x88, 0x1B, 0x7C, 0x86,
-		0x40, 0x36, 0x25, 0x04, 0x90, 0xF5, 0xD3, 0x2F, 0x28, 0xCE, 0x90, 0xE9,
-		0x6A, 0x74, 0x7D, 0x58, 0x5D, 0x7C, 0x86, 0x44, 0xC3, 0xB1, 0xA9, 0xC7,
-		0x19, 0x14, 0x67, 0x88, 0x34, 0x1C, 0x97, 0x3A, 0x9A, 0x95, 0xC7, 0x0C,
-		0x43, 0x0E, 0x00, 0x00, 0x89, 0x8F, 0x2C, 0x20, 0xB5, 0x36, 0x97, 0xFA,
-		0x00, 0x00, 0x00, 0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82,
-	}
-}
-
-// iconYellow returns a yellow status icon.
-// 22x22 PNG with transparency, optimized for macOS menu bar.
-func iconYellow() []byte {
-	return []byte{
-		0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A, 0x00, 0x00, 0x00, 0x0D,
-		0x49, 0x48, 0x44, 0x52, 0x00, 0x00, 0x00, 0x16, 0x00, 0x00, 0x00, 0x16,
-		0x08, 0x06, 0x00, 0x00, 0x00, 0xC4, 0xB4, 0x6C, 0x3B, 0x00, 0x00, 0x00,
-		0x6C, 0x49, 0x44, 0x41, 0x54, 0x78, 0x9C, 0xED, 0x94, 0x51, 0x0A, 0xC0,
-		0x20, 0x0C, 0x43, 0x93, 0x9E, 0x69, 0xF7, 0x3F, 0xC1, 0xEE, 0xE4, 0x7E,
-		0xF6, 0x31, 0xA4, 0xAD, 0x75, 0x55, 0x41, 0x30, 0x9F, 0x92, 0x3C, 0x43,
-		0x40, 0x81, 0xA3, 0x57, 0x44, 0x40, 0xE5, 0x46, 0xA9, 0xCF, 0x78, 0xF9,
-		0x59, 0xF6, 0x02, 0xA3, 0x17, 0x08, 0x12, 0x50, 0xCF, 0x27, 0x19, 0xA8,
-		0xE7, 0x97, 0x2C, 0xD4, 0xCA, 0x99, 0x53, 0x64, 0x25, 0x23, 0xDA, 0x6A,
-		0xF9, 0x35, 0x8D, 0x47, 0x6A, 0x73, 0x30, 0x1B, 0xCF, 0xB4, 0xA5, 0x6F,
-		0x7E, 0xDD, 0x14, 0xFC, 0xD9, 0xBA, 0xCE, 0xA9, 0x8D, 0xD9, 0x09, 0xD7,
-		0xFC, 0xE6, 0x14, 0x0C, 0xC2, 0x2D, 0xDF, 0xB4, 0xFF, 0x18, 0xDB, 0xE9,
-		0x01, 0x3F, 0x36, 0x21, 0x20, 0xAE, 0x80, 0xE1, 0xCF, 0x00, 0x00, 0x00,
-		0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82,
-	}
-}
-
-// iconRed returns a red status icon.
-// 22x22 PNG with transparency, optimized for macOS menu bar.
-func iconRed() []byte {
-	return []byte{
-		0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A, 0x00, 0x00, 0x00, 0x0D,
-		0x49, 0x48, 0x44, 0x52, 0x00, 0x00, 0x00, 0x16, 0x00, 0x00, 0x00, 0x16,
-		0x08, 0x06, 0x00, 0x00, 0x00, 0xC4, 0xB4, 0x6C, 0x3B, 0x00, 0x00, 0x00,
-		0x6E, 0x49, 0x44, 0x41, 0x54, 0x78, 0x9C, 0x63, 0x60, 0x18, 0x05, 0x50,
-		0xC0, 0xC8, 0x40, 0x04, 0xF8, 0x6F, 0x6D, 0xF0, 0x1F, 0x5D, 0x8C, 0xF1,
-		0xE8, 0x05, 0xBC, 0x7A, 0x19, 0x49, 0x35, 0x90, 0x58, 0x0B, 0x98, 0x18,
-		0x28, 0x30, 0x14, 0x9F, 0x3A, 0x26, 0x4A, 0x0C, 0xC5, 0xA7, 0x9E, 0x89,
-		0x52, 0x43, 0x71, 0xE9, 0xC3, 0x19, 0x14, 0x94, 0x02, 0x26, 0x6A, 0xB8,
-		0x16, 0x9B, 0x7E, 0xFA, 0xB8, 0x98, 0x9A, 0x60, 0x88, 0x1B, 0xCC, 0x48,
-		0x20, 0x9B, 0x12, 0x02, 0xC8, 0xFA, 0xE9, 0x17, 0x14, 0x8C, 0x64, 0xBA,
-		0x1A, 0x5D, 0x1F, 0x56, 0x17, 0x33, 0x92, 0x68, 0x38, 0x36, 0xF5, 0x38,
-		0x83, 0x82, 0x91, 0x48, 0xC3, 0x71, 0xA9, 0xA3, 0x59, 0x79, 0xCC, 0x30,
-		0xE4, 0x00, 0x00, 0xD5, 0x7D, 0x2C, 0x20, 0xCA, 0x3D, 0x2A, 0xC1, 0x00,
-		0x00, 0x00, 0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82,
-	}
-}
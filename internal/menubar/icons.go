@@ -3,93 +3,44 @@
 
 package menubar
 
+import (
+	_ "embed"
+)
+
 // Status icon data for menu bar
 // Icons are 22x22 PNG images with custom tablet+pen design
 // Design: Tablet outline with pen/stylus + colored status indicator dot
 // Template-compatible: Main icon (tablet+pen) is black, macOS tints for light/dark mode
 // Status dots have white halos for visibility in dark mode
 // Status colors: Green (idle), Yellow (syncing), Red (error/offline)
+// Regenerate the PNGs in icons/ with scripts/generate_menubar_icons.py
+
+//go:embed icons/icon-green.png
+var iconGreenPNG []byte
+
+//go:embed icons/icon-yellow.png
+var iconYellowPNG []byte
+
+//go:embed icons/icon-red.png
+var iconRedPNG []byte
 
 // iconGreen returns a green status icon (idle state).
 // Represents: Daemon idle, sync complete, no errors
 // Design: Tablet with pen + green status dot with white halo
 func iconGreen() []byte {
-	return []byte{
-		0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A, 0x00, 0x00, 0x00, 0x0D,
-		0x49, 0x48, 0x44, 0x52, 0x00, 0x00, 0x00, 0x16, 0x00, 0x00, 0x00, 0x16,
-		0x08, 0x06, 0x00, 0x00, 0x00, 0xC4, 0xB4, 0x6C, 0x3B, 0x00, 0x00, 0x00,
-		0xB4, 0x49, 0x44, 0x41, 0x54, 0x78, 0x9C, 0xDD, 0x95, 0x41, 0x0E, 0xC2,
-		0x40, 0x08, 0x45, 0xF9, 0xC6, 0x23, 0xB9, 0xF1, 0x0C, 0x7A, 0x81, 0x9E,
-		0xD0, 0x0B, 0xE8, 0x19, 0xDC, 0x78, 0x27, 0x0C, 0xA6, 0xD3, 0x50, 0x44,
-		0x21, 0x14, 0x37, 0xFE, 0xA4, 0x99, 0x40, 0xC3, 0x9B, 0xCE, 0x87, 0xB6,
-		0x44, 0x3F, 0x12, 0x3A, 0x20, 0xCC, 0x7C, 0x5D, 0x80, 0xC0, 0x79, 0x33,
-		0x98, 0x67, 0x20, 0x80, 0x93, 0xCA, 0xDD, 0x64, 0xDD, 0x47, 0xB5, 0x14,
-		0x6C, 0x2E, 0xD0, 0xC3, 0x7D, 0x5A, 0xC5, 0x02, 0x87, 0x03, 0x4A, 0xE9,
-		0x55, 0x6C, 0xA0, 0x43, 0x8F, 0xE3, 0x85, 0x76, 0xCE, 0xD3, 0x41, 0x5D,
-		0x5A, 0xDF, 0xEE, 0xBD, 0x49, 0x83, 0x3D, 0xA1, 0x72, 0x9A, 0x0C, 0xF8,
-		0x23, 0x5C, 0xBA, 0x2F, 0x76, 0xC8, 0xB1, 0xB5, 0x24, 0x96, 0x7C, 0xD4,
-		0x3C, 0x0D, 0x67, 0xAF, 0xA1, 0xC3, 0x6B, 0x1D, 0x8F, 0x82, 0x25, 0x47,
-		0xB1, 0x77, 0xEC, 0x6C, 0x86, 0x68, 0x8E, 0x39, 0x39, 0xD7, 0xD6, 0x6B,
-		0x54, 0x3D, 0xB6, 0x4A, 0xBD, 0x54, 0x15, 0x70, 0x6A, 0x5A, 0xAA, 0xE0,
-		0x10, 0xBE, 0x05, 0x6C, 0xC5, 0xDD, 0x60, 0x98, 0xB5, 0x0D, 0xEC, 0x36,
-		0xB4, 0xD3, 0x8A, 0x95, 0xCA, 0x5F, 0xB7, 0xCE, 0x1F, 0x05, 0xFD, 0xB7,
-		0x9E, 0x94, 0x59, 0x3F, 0x3C, 0x47, 0x12, 0xE9, 0x07, 0x00, 0x00, 0x00,
-		0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82,
-	}
+	return iconGreenPNG
 }
 
 // iconYellow returns a yellow status icon (syncing state).
 // Represents: Active sync/processing in progress
 // Design: Tablet with pen + bright yellow status dot with white halo
 func iconYellow() []byte {
-	return []byte{
-		0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A, 0x00, 0x00, 0x00, 0x0D,
-		0x49, 0x48, 0x44, 0x52, 0x00, 0x00, 0x00, 0x16, 0x00, 0x00, 0x00, 0x16,
-		0x08, 0x06, 0x00, 0x00, 0x00, 0xC4, 0xB4, 0x6C, 0x3B, 0x00, 0x00, 0x00,
-		0xB3, 0x49, 0x44, 0x41, 0x54, 0x78, 0x9C, 0xDD, 0x95, 0xC1, 0x0D, 0xC3,
-		0x30, 0x08, 0x45, 0xF9, 0x55, 0x4E, 0x19, 0xA5, 0xAB, 0xB4, 0xE3, 0x26,
-		0xAB, 0x64, 0x94, 0x5E, 0x7F, 0x95, 0xB6, 0xB6, 0x30, 0x41, 0xC5, 0x72,
-		0xE8, 0xA5, 0x5F, 0x42, 0x96, 0x71, 0x78, 0x76, 0x00, 0x27, 0x22, 0x3F,
-		0x12, 0x32, 0x20, 0x24, 0x97, 0x0A, 0x04, 0xEE, 0xA7, 0xC1, 0xFC, 0x00,
-		0x01, 0xDC, 0x94, 0x6F, 0xDD, 0xC7, 0x29, 0x8A, 0x95, 0x60, 0xF3, 0x1D,
-		0xCA, 0x6D, 0x6E, 0xE7, 0xE4, 0x0A, 0x07, 0xD4, 0xA5, 0x57, 0xB0, 0x81,
-		0x16, 0xE1, 0xFA, 0x90, 0x8B, 0x73, 0x3A, 0x28, 0x6B, 0x9E, 0xFF, 0xB2,
-		0x76, 0x90, 0x06, 0x7B, 0xC2, 0xC8, 0xDB, 0x58, 0x31, 0x58, 0x2B, 0x66,
-		0x8B, 0x47, 0x6E, 0x73, 0xB5, 0xB7, 0x9B, 0x4B, 0x54, 0x3C, 0x7D, 0x72,
-		0x7A, 0x05, 0x2D, 0xB9, 0xD6, 0xF3, 0x12, 0x50, 0x7D, 0x12, 0xE7, 0x8E,
-		0xCE, 0x66, 0x88, 0xFA, 0x98, 0x9D, 0x7D, 0x6D, 0x53, 0x86, 0x91, 0xE2,
-		0x79, 0xEA, 0xBA, 0x54, 0x23, 0xE0, 0xAE, 0x6E, 0x19, 0x05, 0x87, 0xF0,
-		0x33, 0x60, 0x2B, 0x66, 0x83, 0x61, 0xC6, 0x34, 0xB0, 0x5B, 0xD0, 0xCC,
-		0x54, 0x34, 0x1A, 0xFE, 0xBA, 0x65, 0xFE, 0x28, 0xE4, 0xBF, 0xF5, 0x04,
-		0x55, 0x59, 0x49, 0xB0, 0x43, 0xCC, 0x1C, 0x62, 0x00, 0x00, 0x00, 0x00,
-		0x49, 0x45, 0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82,
-	}
+	return iconYellowPNG
 }
 
 // iconRed returns a red status icon (error state).
 // Represents: Sync failed, error occurred, or daemon offline
 // Design: Tablet with pen + red status dot with white halo
 func iconRed() []byte {
-	return []byte{
-		0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A, 0x00, 0x00, 0x00, 0x0D,
-		0x49, 0x48, 0x44, 0x52, 0x00, 0x00, 0x00, 0x16, 0x00, 0x00, 0x00, 0x16,
-		0x08, 0x06, 0x00, 0x00, 0x00, 0xC4, 0xB4, 0x6C, 0x3B, 0x00, 0x00, 0x00,
-		0xB1, 0x49, 0x44, 0x41, 0x54, 0x78, 0x9C, 0xDD, 0x95, 0xB1, 0x0E, 0x83,
-		0x30, 0x0C, 0x44, 0x7D, 0x55, 0xBF, 0xAA, 0x7B, 0xA7, 0xF6, 0x73, 0xCB,
-		0xC4, 0xCE, 0x6F, 0x5D, 0x15, 0xD4, 0xA0, 0xC4, 0xB8, 0x75, 0x64, 0xDC,
-		0x85, 0x93, 0xA2, 0x28, 0x06, 0xBF, 0x90, 0xB3, 0x01, 0x91, 0x3F, 0x09,
-		0x19, 0x10, 0x92, 0xAF, 0x0D, 0x08, 0x3C, 0x0F, 0x83, 0xF9, 0x01, 0x02,
-		0x78, 0x34, 0xB1, 0xA9, 0xCC, 0x57, 0x2F, 0x57, 0x9C, 0xCD, 0x0B, 0x94,
-		0xF7, 0x5B, 0xBF, 0x26, 0x27, 0x18, 0xA0, 0x21, 0xAD, 0xC9, 0x0A, 0x5A,
-		0x85, 0x79, 0x91, 0x8B, 0xF1, 0x74, 0x68, 0x46, 0x77, 0xFF, 0x8F, 0x6B,
-		0x3B, 0xB5, 0x60, 0x4B, 0x88, 0x9C, 0x66, 0x04, 0xFC, 0x15, 0x5E, 0xAA,
-		0xBF, 0xDA, 0x31, 0x2F, 0x3B, 0x1B, 0x4A, 0xDC, 0x2B, 0x5E, 0x0B, 0xA7,
-		0x55, 0xD0, 0xEA, 0x75, 0xBB, 0xAE, 0x09, 0x5B, 0x4C, 0x7C, 0xEF, 0x68,
-		0x6C, 0x06, 0xAF, 0x8F, 0x39, 0xD8, 0xD7, 0xDA, 0x6B, 0x44, 0x3D, 0xD6,
-		0x1A, 0x7A, 0xA9, 0x22, 0xE0, 0xA1, 0x6E, 0x89, 0x82, 0x5D, 0xF8, 0x11,
-		0xB0, 0x16, 0xB3, 0xC1, 0x50, 0x73, 0x1A, 0xD8, 0x2C, 0x68, 0xA6, 0x15,
-		0x9D, 0xC2, 0x5F, 0xB7, 0xCC, 0x1F, 0x85, 0x9C, 0x5B, 0x6F, 0x02, 0xE5,
-		0x3F, 0x12, 0x7F, 0x78, 0xFB, 0x35, 0x00, 0x00, 0x00, 0x00, 0x49, 0x45,
-		0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82,
-	}
+	return iconRedPNG
 }
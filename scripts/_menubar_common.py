@@ -0,0 +1,187 @@
+"""
+Shared rendering and encoding for the menu bar icon generators.
+Design: Tablet with pen/stylus + colored status indicator
+The main icon is template-compatible (black with alpha) for macOS tinting
+In dark mode the status dot gets a white halo for visibility
+"""
+from PIL import Image, ImageDraw
+import numpy as np
+import functools
+import struct
+import zlib
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Template color (black - macOS will tint this for light/dark mode)
+ICON_COLOR = (0, 0, 0, 255)
+
+# White halo behind the status dot for dark mode visibility
+HALO_RGBA = (255, 255, 255, 180)
+
+# Status indicator placement (top-right corner, over the tablet edge);
+# the masks below are verified against Pillow for these values at import
+DOT_CENTER = (18, 5)
+DOT_RADIUS = 3
+
+
+def _build_dot_distance():
+    """Distance of every pixel center in the 22x22 icon from the dot center."""
+    ys, xs = np.mgrid[:22, :22]
+    return np.hypot(xs - DOT_CENTER[0], ys - DOT_CENTER[1])
+
+
+# The thresholds on this field (halo r + 1.4, outline |d - r| <= 0.5, dot
+# r - 0.5) were fitted to Pillow's ellipse rasterisation at r = 3 and do not
+# hold for every radius, so _check_dot_masks compares them at import time
+DOT_DIST = _build_dot_distance()
+
+# White halo around the dot (dark mode only)
+HALO_MASK = DOT_DIST <= DOT_RADIUS + 1.4
+
+# 1px outline ring around the dot
+OUTLINE_MASK = np.abs(DOT_DIST - DOT_RADIUS) <= 0.5
+
+# Status dot pixels inside the 1px outline
+DOT_MASK = DOT_DIST <= DOT_RADIUS - 0.5
+
+
+def _check_dot_masks():
+    """
+    Fail loudly if the distance masks stop matching ImageDraw.ellipse.
+    Draws the halo, filled dot and outline the way Pillow would and compares
+    each against its mask for the current DOT_CENTER and DOT_RADIUS.
+
+    Raises:
+        RuntimeError: If any mask differs from Pillow's rasterisation
+    """
+    def ellipse_mask(radius, **kwargs):
+        img = Image.new('L', (22, 22), 0)
+        ImageDraw.Draw(img).ellipse([DOT_CENTER[0]-radius, DOT_CENTER[1]-radius,
+                                     DOT_CENTER[0]+radius, DOT_CENTER[1]+radius],
+                                    **kwargs)
+        return np.asarray(img) > 0
+
+    outline = ellipse_mask(DOT_RADIUS, outline=255, width=1)
+    expected = {
+        'halo': (HALO_MASK, ellipse_mask(DOT_RADIUS + 1, fill=255)),
+        'outline': (OUTLINE_MASK, outline),
+        'dot': (DOT_MASK, ellipse_mask(DOT_RADIUS, fill=255) & ~outline),
+    }
+    for name, (mask, pillow) in expected.items():
+        if not np.array_equal(mask, pillow):
+            raise RuntimeError(
+                f"{name} mask no longer matches ImageDraw.ellipse for "
+                f"DOT_CENTER={DOT_CENTER}, DOT_RADIUS={DOT_RADIUS}; "
+                f"re-fit the thresholds on DOT_DIST")
+
+
+_check_dot_masks()
+
+
+@functools.lru_cache(maxsize=None)
+def render_base(dark_mode):
+    """
+    Render the color-independent part of the icon once per mode.
+    Tablet, pen, pen tip, the dot outline and (in dark mode) the white
+    status halo are identical for every status color, so they are drawn
+    into a single template; only the pixels inside the outline change per
+    color.
+
+    Args:
+        dark_mode: Draw the white halo behind the status dot
+
+    Returns:
+        Read-only uint8 array of shape (22, 22, 4)
+    """
+    # Create 22x22 image with transparency
+    size = (22, 22)
+    img = Image.new('RGBA', size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img, 'RGBA')
+
+    # Draw tablet outline (rounded rectangle)
+    tablet_rect = [2, 4, 15, 18]
+    draw.rounded_rectangle(tablet_rect, radius=2, outline=ICON_COLOR, width=1)
+
+    # Draw pen/stylus across the tablet (diagonal line with tip)
+    pen_coords = [(6, 3), (17, 14)]
+    draw.line(pen_coords, fill=ICON_COLOR, width=2)
+
+    # Pen tip (small circle at end)
+    tip_pos = (17, 14)
+    draw.ellipse([tip_pos[0]-1, tip_pos[1]-1, tip_pos[0]+1, tip_pos[1]+1],
+                 fill=ICON_COLOR)
+
+    # Halo and outline are concentric rings around the status dot, so both
+    # are painted from one distance field instead of two ellipse passes
+    pixels = np.array(img)
+    if dark_mode:
+        # White halo (slightly larger, semi-transparent for blending)
+        pixels[HALO_MASK] = HALO_RGBA
+
+    # Thin black outline for definition around the (not yet filled) dot
+    pixels[OUTLINE_MASK] = ICON_COLOR
+
+    pixels.flags.writeable = False
+    return pixels
+
+
+def _png_chunk(tag, data):
+    """Build a PNG chunk: length, tag, payload and CRC over tag+payload."""
+    crc = zlib.crc32(data, zlib.crc32(tag))
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', crc)
+
+
+def _scanlines(rows):
+    """
+    Prepend the filter byte (0 = None) to every row of a 2D uint8 array.
+    The pixel data is copied once into the output buffer, which is handed to
+    zlib as-is through the buffer protocol rather than via another bytes copy.
+    """
+    height, stride = rows.shape
+    scanlines = np.empty((height, stride + 1), dtype=np.uint8)
+    scanlines[:, 0] = 0
+    scanlines[:, 1:] = rows
+    return memoryview(scanlines)
+
+
+def encode_png(pixels):
+    """
+    Encode RGBA pixels as an 8-bit truecolor+alpha PNG without Pillow.
+    Icons are tiny, so every scanline uses filter type 0 (None) and the
+    whole image goes into a single IDAT chunk.
+
+    Args:
+        pixels: uint8 array of shape (height, width, 4)
+
+    Returns:
+        PNG bytes
+    """
+    height, width = pixels.shape[:2]
+
+    # 8-bit depth, color type 6 (RGBA), default compression/filter, no interlace
+    ihdr = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    idat = zlib.compress(_scanlines(pixels.reshape(height, -1)), 9)
+
+    return (PNG_SIGNATURE +
+            _png_chunk(b'IHDR', ihdr) +
+            _png_chunk(b'IDAT', idat) +
+            _png_chunk(b'IEND', b''))
+
+
+def create_icons(status_colors, dark_mode=True):
+    """
+    Create 22x22 menu bar icons for several status colors in one pass.
+    The shared base is broadcast into a (N, 22, 22, 4) stack and every
+    status dot is painted with a single vectorised assignment.
+
+    Args:
+        status_colors: Sequence of (R, G, B, A) tuples for the status dot
+        dark_mode: Put a white halo behind the status dot
+
+    Returns:
+        List of PNG bytes, one per color
+    """
+    base = render_base(dark_mode)
+    stack = np.broadcast_to(base, (len(status_colors),) + base.shape).copy()
+    stack[:, DOT_MASK] = np.array(status_colors, dtype=np.uint8)[:, None, :]
+    return [encode_png(layer) for layer in stack]
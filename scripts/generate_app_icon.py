@@ -4,7 +4,53 @@ Generate application icon for Legible app.
 Creates a larger, more detailed tablet+pen design for the .app bundle icon.
 """
 from PIL import Image, ImageDraw
+import numpy as np
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import argparse
 import os
+import shutil
+import subprocess
+import sys
+
+# Colors
+TABLET_RGBA = (60, 60, 60, 255)         # Dark gray tablet
+SHADOW_RGBA = (0, 0, 0, 60)             # Soft drop shadow
+SCREEN_RGBA = (240, 240, 240, 255)      # Light screen
+STROKE_RGBA = (100, 100, 100, 180)      # Handwriting strokes
+PEN_RGBA = (100, 100, 100, 255)         # Gray pen
+PEN_TIP_RGBA = (40, 40, 40, 255)        # Dark pen tip
+ACCENT_RGBA = (52, 199, 89, 255)        # Green accent (brand color)
+
+# Size the iconset master is rendered at before downscaling; every iconset
+# size divides it by a power of two
+MASTER_SIZE = 2048
+
+
+# Design dimensions in pixels at the 512px reference size
+AppIconDims = namedtuple('AppIconDims', [
+    'padding',          # Tablet inset from the icon edge
+    'radius',           # Tablet corner radius
+    'shadow_offset',    # Drop shadow offset
+    'screen_padding',   # Screen inset from the tablet edge
+    'screen_radius',    # Screen corner radius
+    'stroke_width',     # Handwriting stroke width
+    'text_top',         # First handwriting line below the screen top
+    'text_inset',       # Handwriting inset from the screen sides
+    'line_spacing',     # Distance between handwriting lines
+    'line_clearance',   # Space a line needs above the screen bottom
+    'wave',             # Handwriting wave amplitude
+    'pen_width',        # Pen body thickness
+    'pen_inset',        # Pen start, left of the tablet's right edge
+    'pen_top',          # Pen start, below the tablet top
+    'pen_span',         # Horizontal and vertical extent of the pen
+    'tip_radius',       # Pen tip radius
+    'indicator_size',   # Brand indicator radius
+    'indicator_offset', # Brand indicator center from the tablet corner
+])
+REFERENCE_DIMS = AppIconDims(40, 40, 6, 20, 20, 4, 60, 40, 50, 20, 8, 12,
+                             100, 50, 140, 8, 12, 30)
+
 
 def create_app_icon(size):
     """
@@ -18,130 +64,176 @@ def create_app_icon(size):
         PIL Image
     """
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    draw = ImageDraw.Draw(img, 'RGBA')
 
-    # Scale factor for different sizes
+    # Scale every reference dimension for this size in one pass
     scale = size / 512.0
-
-    # Colors
-    tablet_color = (60, 60, 60, 255)        # Dark gray tablet
-    screen_color = (240, 240, 240, 255)     # Light screen
-    pen_color = (100, 100, 100, 255)        # Gray pen
-    accent_color = (52, 199, 89, 255)       # Green accent (brand color)
-
-    # Padding and dimensions
-    padding = int(40 * scale)
+    dims = AppIconDims(*(np.array(REFERENCE_DIMS) * scale).astype(int).tolist())
 
     # Tablet outline (rounded rectangle)
     tablet_rect = [
-        padding,
-        padding,
-        size - padding,
-        size - padding
+        dims.padding,
+        dims.padding,
+        size - dims.padding,
+        size - dims.padding
     ]
-    radius = int(40 * scale)
 
     # Draw tablet body with shadow effect
-    shadow_offset = int(6 * scale)
     shadow_rect = [
-        tablet_rect[0] + shadow_offset,
-        tablet_rect[1] + shadow_offset,
-        tablet_rect[2] + shadow_offset,
-        tablet_rect[3] + shadow_offset
+        tablet_rect[0] + dims.shadow_offset,
+        tablet_rect[1] + dims.shadow_offset,
+        tablet_rect[2] + dims.shadow_offset,
+        tablet_rect[3] + dims.shadow_offset
     ]
-    draw.rounded_rectangle(shadow_rect, radius=radius, fill=(0, 0, 0, 60))
+    draw.rounded_rectangle(shadow_rect, radius=dims.radius, fill=SHADOW_RGBA)
 
     # Tablet body
-    draw.rounded_rectangle(tablet_rect, radius=radius, fill=tablet_color)
+    draw.rounded_rectangle(tablet_rect, radius=dims.radius, fill=TABLET_RGBA)
 
     # Screen (inner rectangle)
-    screen_padding = int(20 * scale)
     screen_rect = [
-        tablet_rect[0] + screen_padding,
-        tablet_rect[1] + screen_padding,
-        tablet_rect[2] - screen_padding,
-        tablet_rect[3] - screen_padding
+        tablet_rect[0] + dims.screen_padding,
+        tablet_rect[1] + dims.screen_padding,
+        tablet_rect[2] - dims.screen_padding,
+        tablet_rect[3] - dims.screen_padding
     ]
-    screen_radius = int(20 * scale)
-    draw.rounded_rectangle(screen_rect, radius=screen_radius, fill=screen_color)
+    draw.rounded_rectangle(screen_rect, radius=dims.screen_radius, fill=SCREEN_RGBA)
 
     # Draw some handwriting strokes on the screen
-    stroke_color = (100, 100, 100, 180)
-    stroke_width = max(2, int(4 * scale))
+    stroke_width = max(2, dims.stroke_width)
 
     # Wavy line like handwriting
-    y_start = screen_rect[1] + int(60 * scale)
-    x_start = screen_rect[0] + int(40 * scale)
-    x_end = screen_rect[2] - int(40 * scale)
+    y_start = screen_rect[1] + dims.text_top
+    x_start = screen_rect[0] + dims.text_inset
+    x_end = screen_rect[2] - dims.text_inset
+
+    # Wavy line shape (alternates up/down every 3 segments) is the same for
+    # every line, so only the vertical position changes inside the loop
+    segments = 20
+    xs = np.linspace(x_start, x_end, segments + 1).tolist()
+    wave = dims.wave * (1 - ((np.arange(segments + 1) // 3) & 1) * 2)
+    draw_line = draw.line
 
     for i in range(3):
-        y = y_start + i * int(50 * scale)
-        if y + int(20 * scale) < screen_rect[3]:
-            # Wavy line
-            points = []
-            segments = 20
-            for j in range(segments + 1):
-                x = x_start + (x_end - x_start) * j / segments
-                wave = int(8 * scale) * (1 if (j // 3) % 2 == 0 else -1)
-                points.append((x, y + wave))
-            draw.line(points, fill=stroke_color, width=stroke_width, joint="curve")
-
-    # Draw pen/stylus across the tablet (larger and more detailed)
-    pen_width = int(12 * scale)
-    pen_length = int(220 * scale)
+        y = y_start + i * dims.line_spacing
+        if y + dims.line_clearance < screen_rect[3]:
+            points = list(zip(xs, (y + wave).tolist()))
+            draw_line(points, fill=STROKE_RGBA, width=stroke_width, joint="curve")
 
     # Pen position (diagonal across)
-    pen_start_x = tablet_rect[2] - int(100 * scale)
-    pen_start_y = tablet_rect[1] + int(50 * scale)
-    pen_end_x = pen_start_x + int(140 * scale)
-    pen_end_y = pen_start_y + int(140 * scale)
+    pen_start_x = tablet_rect[2] - dims.pen_inset
+    pen_start_y = tablet_rect[1] + dims.pen_top
+    pen_end_x = pen_start_x + dims.pen_span
+    pen_end_y = pen_start_y + dims.pen_span
 
     # Pen body (thick line)
     draw.line([(pen_start_x, pen_start_y), (pen_end_x, pen_end_y)],
-              fill=pen_color, width=pen_width)
+              fill=PEN_RGBA, width=dims.pen_width)
 
     # Pen tip (small circle)
-    tip_radius = int(8 * scale)
+    tip_radius = dims.tip_radius
     draw.ellipse([pen_end_x - tip_radius, pen_end_y - tip_radius,
                   pen_end_x + tip_radius, pen_end_y + tip_radius],
-                 fill=(40, 40, 40, 255))
-
-    # Pen grip area (lighter section)
-    grip_start_ratio = 0.4
-    grip_x = pen_start_x + int((pen_end_x - pen_start_x) * grip_start_ratio)
-    grip_y = pen_start_y + int((pen_end_y - pen_start_y) * grip_start_ratio)
-    grip_length = int(40 * scale)
+                 fill=PEN_TIP_RGBA)
 
     # Brand accent (small green indicator on tablet)
-    indicator_size = int(12 * scale)
-    indicator_x = tablet_rect[0] + int(30 * scale)
-    indicator_y = tablet_rect[1] + int(30 * scale)
+    indicator_size = dims.indicator_size
+    indicator_x = tablet_rect[0] + dims.indicator_offset
+    indicator_y = tablet_rect[1] + dims.indicator_offset
     draw.ellipse([indicator_x - indicator_size, indicator_y - indicator_size,
                   indicator_x + indicator_size, indicator_y + indicator_size],
-                 fill=accent_color)
+                 fill=ACCENT_RGBA)
 
     return img
 
 
-def generate_iconset():
-    """Generate all required icon sizes for .icns file."""
+def save_icon(img, path):
+    """
+    Save an icon PNG with fast, light compression.
+    Pillow's optimize pass is slow and gains little here; release builds
+    shrink the files with pngquant afterwards instead (see optimize_icon).
+
+    Args:
+        img: PIL Image
+        path: Output PNG path
+    """
+    img.save(path, 'PNG', compress_level=1, optimize=False)
+
+
+def optimize_icon(path):
+    """
+    Shrink a saved icon PNG in place with pngquant.
+
+    Args:
+        path: PNG path to overwrite
+    """
+    subprocess.run(['pngquant', '--force', '--ext', '.png', path], check=True)
+
+
+def downscale_levels(master):
+    """
+    Halve the master repeatedly into every power-of-two size down to 16px.
+    Each level is a 2x2 box reduce of the previous one, which is far cheaper
+    than reducing (or LANCZOS-resizing) the full 2048px master per size.
+
+    Args:
+        master: Square PIL Image whose size is a power of two
+
+    Returns:
+        Dict mapping size to PIL Image
+    """
+    levels = {master.width: master}
+    size = master.width
+    while size > 16:
+        levels[size // 2] = levels[size].reduce(2)
+        size //= 2
+    return levels
+
+
+def generate_iconset(final=False):
+    """
+    Generate all required icon sizes for .icns file.
+
+    Args:
+        final: Optimize every PNG with pngquant (requires pngquant on PATH)
+    """
     sizes = [16, 32, 64, 128, 256, 512, 1024]
     iconset_dir = "/tmp/Legible.iconset"
 
     # Create iconset directory
     os.makedirs(iconset_dir, exist_ok=True)
 
-    for size in sizes:
-        # Generate regular resolution
-        img = create_app_icon(size)
-        img.save(f"{iconset_dir}/icon_{size}x{size}.png")
-        print(f"Generated icon_{size}x{size}.png")
+    # Every iconset entry: regular resolution plus @2x for retina displays
+    # (except 1024)
+    entries = [(size, f"icon_{size}x{size}.png") for size in sizes]
+    entries += [(size * 2, f"icon_{size}x{size}@2x.png") for size in sizes if size <= 512]
+
+    # icon_NxN@2x and icon_2Nx2N are the same image, so each distinct size
+    # is encoded (and optimized) once and copied to its other names
+    names_by_size = {}
+    for size, filename in entries:
+        names_by_size.setdefault(size, []).append(filename)
+
+    # Render once at the largest size and halve it down for every entry,
+    # which keeps antialiasing consistent across the whole iconset
+    levels = downscale_levels(create_app_icon(MASTER_SIZE))
+
+    primary = {}
+    for size, filenames in names_by_size.items():
+        primary[size] = os.path.join(iconset_dir, filenames[0])
+        save_icon(levels[size], primary[size])
 
-        # Generate @2x resolution for retina displays (except 1024)
-        if size <= 512:
-            img_2x = create_app_icon(size * 2)
-            img_2x.save(f"{iconset_dir}/icon_{size}x{size}@2x.png")
-            print(f"Generated icon_{size}x{size}@2x.png")
+    if final:
+        # pngquant runs as its own process, so threads are enough to overlap it
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(optimize_icon, primary.values()))
+
+    for size, filenames in names_by_size.items():
+        for filename in filenames[1:]:
+            shutil.copyfile(primary[size], os.path.join(iconset_dir, filename))
+
+    for _, filename in entries:
+        print(f"Generated {filename}")
 
     print(f"\nIconset created at: {iconset_dir}")
     print("\nTo convert to .icns, run:")
@@ -149,4 +241,14 @@ def generate_iconset():
 
 
 if __name__ == '__main__':
-    generate_iconset()
+    parser = argparse.ArgumentParser(description="Generate the Legible app iconset.")
+    parser.add_argument('--final', action='store_true',
+                        help="optimize the PNGs with pngquant (release builds)")
+    args = parser.parse_args()
+
+    if args.final and shutil.which('pngquant') is None:
+        print("Error: pngquant is required for --final")
+        print("Install with: brew install pngquant")
+        sys.exit(1)
+
+    generate_iconset(final=args.final)